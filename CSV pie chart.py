@@ -1,8 +1,9 @@
 import bpy
 import csv
+import functools
 import math
-import random
-from mathutils import Vector, Euler
+import numpy as np
+from mathutils import Euler
 import os
 
 bl_info = {
@@ -17,6 +18,210 @@ bl_info = {
     "category": "Object",
 }
 
+# Parsed CSV files keyed by (absolute path, modification time), shared by all operators
+_CSV_CACHE = {}
+
+def _load_csv(csv_file_path):
+    """Returns (header, rows) for a CSV file, reusing the cached parse while the file is unchanged."""
+    key = (csv_file_path, os.stat(csv_file_path).st_mtime)
+    cached = _CSV_CACHE.get(key)
+    if cached is None:
+        with open(csv_file_path, 'r', encoding='utf-8') as file:
+            reader = csv.reader(file)
+            header = next(reader) # Read header row
+            rows = list(reader)
+        _CSV_CACHE.clear() # Only keep the most recently read file
+        cached = _CSV_CACHE[key] = (header, rows)
+    return cached
+
+# Names of chart meshes and font curves freed by a previous Generate, reused by the next one
+_MESH_POOL = []
+_CURVE_POOL = []
+
+def _take_pooled(pool, id_collection, name):
+    """Pops an unused datablock from a pool and renames it, or returns None if the pool is empty."""
+    while pool:
+        block = id_collection.get(pool.pop())
+        if block is not None and block.users == 0:
+            block.name = name
+            return block
+    return None
+
+# Deliberate duplicate of _to_float_array in "CSV viz.py": each add-on is a standalone file, so keep both copies in sync
+def _to_float_array(cells, dtype=np.float64):
+    """Converts a column of CSV cells to a float array, using NaN for non-numeric cells."""
+    try:
+        return np.array(cells, dtype=dtype) # Fast path: every cell is numeric
+    except ValueError:
+        # Dirty columns tend to repeat the same few bad cells, so each distinct cell is parsed only once
+        uniques, inverse = np.unique(cells, return_inverse=True)
+        unique_values = np.full(len(uniques), np.nan, dtype=dtype)
+        for i, cell in enumerate(uniques.tolist()):
+            try:
+                unique_values[i] = float(cell)
+            except ValueError:
+                pass
+        return unique_values[inverse]
+
+class _SliceDataError(Exception):
+    """Raised by _prepare_slices for CSV problems that are reported to the user as-is."""
+
+@functools.lru_cache(maxsize=8)
+def _prepare_slices(csv_file_path, mtime, label_col_name, value_col_name, sort_by):
+    """Returns read-only (labels, values, warnings) for the valid, sorted slices of a CSV file.
+
+    mtime is only part of the cache key, so editing the file invalidates earlier results.
+    """
+    header, rows = _load_csv(csv_file_path)
+    if label_col_name not in header or value_col_name not in header:
+        raise _SliceDataError(f"Column names not found. Available: {', '.join(header)}")
+    label_idx = header.index(label_col_name)
+    value_idx = header.index(value_col_name)
+
+    rows = [row for row in rows if row] # Skip blank lines
+    for row in rows:
+        if len(row) <= max(label_idx, value_idx):
+            raise _SliceDataError(f"Missing column in row: {row}. Check column names.")
+
+    labels = np.array([row[label_idx] for row in rows], dtype=str)
+    value_cells = [row[value_idx] for row in rows]
+    values = _to_float_array(value_cells)
+
+    # Mask out non-numeric and negative values in one pass
+    warnings = []
+    non_numeric = ~np.isfinite(values)
+    negative = values < 0
+    if non_numeric.any():
+        first = np.flatnonzero(non_numeric)[0]
+        warnings.append(f"Skipping {non_numeric.sum()} non-numeric value(s), e.g. '{value_cells[first]}' for label '{labels[first]}'")
+    if negative.any():
+        first = np.flatnonzero(negative)[0]
+        warnings.append(f"Skipping {negative.sum()} negative value(s), e.g. {values[first]} for label {labels[first]}")
+    valid = ~(non_numeric | negative)
+    labels = labels[valid]
+    values = values[valid]
+
+    # --- Sort Data based on user selection ---
+    if sort_by == 'VALUE_DESCENDING':
+        order = np.argsort(-values, kind='stable')
+        labels, values = labels[order], values[order]
+    elif sort_by == 'LABEL_ASCENDING':
+        order = np.argsort(labels, kind='stable')
+        labels, values = labels[order], values[order]
+
+    # Cached results are shared between runs, so guard them against in-place edits
+    labels.setflags(write=False)
+    values.setflags(write=False)
+    return labels, values, tuple(warnings)
+
+@functools.lru_cache(maxsize=8)
+def _golden_palette(count, saturation=0.6, value=0.85):
+    """Returns read-only (count, 3) RGB colors whose hues step around the color wheel by the golden ratio."""
+    hues = (np.arange(count) * 0.6180339887) % 1.0
+    k = (np.array([5.0, 3.0, 1.0]) + hues[:, None] * 6.0) % 6.0 # Vectorized HSV -> RGB
+    colors = value - value * saturation * np.clip(np.minimum(k, 4.0 - k), 0.0, 1.0)
+    colors.setflags(write=False)
+    return colors
+
+def _slice_material():
+    """Returns the material shared by every slice, creating it on first use.
+
+    Base Color comes from Object Info, so each slice is tinted by its own obj.color in Material
+    Preview and Render. Solid shading shows those colors with the viewport's Object color type.
+    """
+    mat = bpy.data.materials.get("PieSliceMat")
+    if mat is None:
+        mat = bpy.data.materials.new("PieSliceMat")
+        mat.use_nodes = True
+        nodes = mat.node_tree.nodes
+        bsdf = nodes.get("Principled BSDF")
+        if bsdf is not None:
+            object_info = nodes.new("ShaderNodeObjectInfo")
+            object_info.location = (bsdf.location.x - 250, bsdf.location.y)
+            mat.node_tree.links.new(object_info.outputs["Color"], bsdf.inputs["Base Color"])
+    return mat
+
+def _make_text(name, body, size, location, rotation, font):
+    """Creates a centered text object, reusing a pooled font curve when one is available."""
+    curve = _take_pooled(_CURVE_POOL, bpy.data.curves, name)
+    if curve is None:
+        curve = bpy.data.curves.new(name, type='FONT')
+    curve.font = font
+    curve.body = body
+    curve.size = size
+    curve.align_x = 'CENTER'
+    curve.align_y = 'CENTER'
+    text_obj = bpy.data.objects.new(name, curve)
+    text_obj.location = location
+    text_obj.rotation_euler = rotation
+    return text_obj
+
+# Raw RNA values of the keyframe interpolation and handle type enums, for keyframe_points.foreach_set.
+# 'AUTO' is the creation ease option for Bezier interpolation with automatic handles
+_INTERPOLATION_VALUES = {
+    'CONSTANT': 0, 'LINEAR': 1, 'BEZIER': 2, 'AUTO': 2, 'BACK': 3, 'BOUNCE': 4, 'CIRC': 5, 'CUBIC': 6,
+    'ELASTIC': 7, 'EXPO': 8, 'QUAD': 9, 'QUART': 10, 'QUINT': 11, 'SINE': 12,
+}
+_HANDLE_VALUES = {'FREE': 0, 'AUTO': 1, 'VECTOR': 2, 'ALIGNED': 3, 'AUTO_CLAMPED': 4}
+
+def _key_channels(obj, data_path, start_frame, end_frame, start_values, end_values, first_index=0):
+    """Keys obj.<data_path> from start_values to end_values in the object's own action."""
+    anim_data = obj.animation_data or obj.animation_data_create()
+    action = anim_data.action
+    if action is None:
+        action = anim_data.action = bpy.data.actions.new(obj.name + "Action")
+    return _add_key_pairs(action, data_path, start_frame, end_frame, start_values, end_values, first_index)
+
+def _add_key_pairs(action, data_path, start_frame, end_frame, start_values, end_values, first_index=0):
+    """Adds two-key fcurves for <data_path> to an action, writing each fcurve in one bulk call.
+
+    Channel i of the values goes to array index first_index + i. Returns the new fcurves.
+    """
+    fcurves = []
+    for index, (start_value, end_value) in enumerate(zip(start_values, end_values), first_index):
+        fcurve = action.fcurves.new(data_path, index=index, action_group="Object Transforms")
+        fcurve.keyframe_points.add(2)
+        fcurve.keyframe_points.foreach_set("co", (start_frame, start_value, end_frame, end_value))
+        fcurve.update()
+        fcurves.append(fcurve)
+    return fcurves
+
+def _apply_ease(action, prefix, interpolation, handle):
+    """Sets interpolation and both handle types on every keyframe of an action's fcurves under a data path prefix."""
+    if action is None:
+        return
+    for fcurve in action.fcurves:
+        if not fcurve.data_path.startswith(prefix):
+            continue
+        keyframe_points = fcurve.keyframe_points
+        key_count = len(keyframe_points)
+        keyframe_points.foreach_set("interpolation", [interpolation] * key_count)
+        keyframe_points.foreach_set("handle_left_type", [handle] * key_count)
+        keyframe_points.foreach_set("handle_right_type", [handle] * key_count)
+        fcurve.update()
+
+def _add_strip(obj, action, start_frame):
+    """Plays a shared action on obj from start_frame on a new NLA track."""
+    anim_data = obj.animation_data or obj.animation_data_create()
+    track = anim_data.nla_tracks.new()
+    # strips.new only takes whole frames, so the strip is moved to the exact start afterwards
+    strip = track.strips.new(action.name, int(round(start_frame)), action)
+    offset = start_frame - strip.frame_start
+    if offset:
+        if hasattr(strip, "frame_start_ui"):
+            strip.frame_start_ui = start_frame # Moves the strip, keeping its length (Blender 3.3+)
+        else:
+            # Older versions resize on each end (and setting frame_end rescales the strip), so move
+            # the leading end first to keep start < end, then restore the original speed and length
+            if offset > 0:
+                strip.frame_end += offset
+                strip.frame_start = start_frame
+            else:
+                strip.frame_start = start_frame
+                strip.frame_end += offset
+            strip.scale = 1.0
+            strip.frame_end = strip.frame_start + (strip.action_frame_end - strip.action_frame_start)
+
 class CSV_OT_AutodetectColumns(bpy.types.Operator):
     """Autodetect Label and Value Columns from CSV"""
     bl_idname = "csv.autodetect_columns"
@@ -26,8 +231,8 @@ class CSV_OT_AutodetectColumns(bpy.types.Operator):
     @classmethod
     def poll(cls, context):
         # Only enable if a CSV file path is set and the file exists
-        return context.scene.csv_pie_chart_props.csv_file_path != "" and \
-               os.path.exists(bpy.path.abspath(context.scene.csv_pie_chart_props.csv_file_path))
+        csv_file_path = context.scene.csv_pie_chart_props.csv_file_path
+        return csv_file_path != "" and os.path.exists(bpy.path.abspath(csv_file_path))
 
     def execute(self, context):
         props = context.scene.csv_pie_chart_props
@@ -38,76 +243,69 @@ class CSV_OT_AutodetectColumns(bpy.types.Operator):
             return {'CANCELLED'}
 
         try:
-            with open(csv_file_path, 'r', encoding='utf-8') as file:
-                reader = csv.reader(file)
-                header = next(reader) # Read header row
-                
-                # Read a few sample rows to infer types
-                sample_rows = []
-                for _ in range(5): # Sample first 5 data rows
-                    try:
-                        sample_rows.append(next(reader))
-                    except StopIteration:
-                        break # End of file
-
-                numeric_cols = []
-                string_cols = []
-
-                for i, col_name in enumerate(header):
-                    is_numeric_candidate = True
-                    if not sample_rows: # If no data rows, assume string for all
+            header, rows = _load_csv(csv_file_path)
+
+            # Use a few sample rows to infer types
+            sample_rows = rows[:5] # Sample first 5 data rows
+
+            numeric_cols = []
+            string_cols = []
+
+            for i, col_name in enumerate(header):
+                is_numeric_candidate = True
+                if not sample_rows: # If no data rows, assume string for all
+                    is_numeric_candidate = False
+                else:
+                    numeric_count = 0
+                    for row in sample_rows:
+                        if i < len(row): # Ensure column exists in this row
+                            try:
+                                float(row[i])
+                                numeric_count += 1
+                            except ValueError:
+                                pass
+                    # If more than 80% of sampled values are numeric, consider it a numeric column
+                    if numeric_count / len(sample_rows) < 0.8:
                         is_numeric_candidate = False
-                    else:
-                        numeric_count = 0
-                        for row in sample_rows:
-                            if i < len(row): # Ensure column exists in this row
-                                try:
-                                    float(row[i])
-                                    numeric_count += 1
-                                except ValueError:
-                                    pass
-                        # If more than 80% of sampled values are numeric, consider it a numeric column
-                        if numeric_count / len(sample_rows) < 0.8:
-                            is_numeric_candidate = False
-
-                    if is_numeric_candidate:
-                        numeric_cols.append(col_name)
-                    else:
-                        string_cols.append(col_name)
-
-                # Prioritize common names for value and label columns
-                value_keywords = ['sales', 'amount', 'value', 'count', 'total']
-                label_keywords = ['category', 'item', 'name', 'description', 'type']
-
-                found_value_col = None
-                for col in numeric_cols:
-                    if col.lower() in value_keywords:
-                        found_value_col = col
-                        break
-                if not found_value_col and numeric_cols:
-                    found_value_col = numeric_cols[0] # Fallback to first numeric
-
-                found_label_col = None
-                for col in string_cols:
-                    if col.lower() in label_keywords:
-                        found_label_col = col
-                        break
-                if not found_label_col and string_cols:
-                    found_label_col = string_cols[0] # Fallback to first string
-
-                if found_label_col:
-                    props.label_column = found_label_col
-                if found_value_col:
-                    props.value_column = found_value_col
-
-                if not found_label_col and not found_value_col:
-                    self.report({'WARNING'}, "Could not confidently autodetect columns. Please set manually.")
-                elif not found_label_col:
-                    self.report({'WARNING'}, "Could not autodetect label column. Please set manually.")
-                elif not found_value_col:
-                    self.report({'WARNING'}, "Could not autodetect value column. Please set manually.")
+
+                if is_numeric_candidate:
+                    numeric_cols.append(col_name)
                 else:
-                    self.report({'INFO'}, f"Autodetected: Label='{found_label_col}', Value='{found_value_col}'")
+                    string_cols.append(col_name)
+
+            # Prioritize common names for value and label columns
+            value_keywords = ['sales', 'amount', 'value', 'count', 'total']
+            label_keywords = ['category', 'item', 'name', 'description', 'type']
+
+            found_value_col = None
+            for col in numeric_cols:
+                if col.lower() in value_keywords:
+                    found_value_col = col
+                    break
+            if not found_value_col and numeric_cols:
+                found_value_col = numeric_cols[0] # Fallback to first numeric
+
+            found_label_col = None
+            for col in string_cols:
+                if col.lower() in label_keywords:
+                    found_label_col = col
+                    break
+            if not found_label_col and string_cols:
+                found_label_col = string_cols[0] # Fallback to first string
+
+            if found_label_col:
+                props.label_column = found_label_col
+            if found_value_col:
+                props.value_column = found_value_col
+
+            if not found_label_col and not found_value_col:
+                self.report({'WARNING'}, "Could not confidently autodetect columns. Please set manually.")
+            elif not found_label_col:
+                self.report({'WARNING'}, "Could not autodetect label column. Please set manually.")
+            elif not found_value_col:
+                self.report({'WARNING'}, "Could not autodetect value column. Please set manually.")
+            else:
+                self.report({'INFO'}, f"Autodetected: Label='{found_label_col}', Value='{found_value_col}'")
 
         except FileNotFoundError:
             self.report({'ERROR'}, f"File not found: {csv_file_path}")
@@ -145,12 +343,16 @@ class CSV_OT_GeneratePieChart(bpy.types.Operator):
         sort_by = props.sort_by
         chart_title = props.chart_title
         label_horizontal_orientation = props.label_horizontal_orientation
+        explode_factor = props.explode_factor
         
         # Animation Properties
         animate_creation = props.animate_creation
         animation_duration = props.animation_duration
         animation_offset = props.animation_offset
         creation_ease_type = props.creation_ease_type
+        # Linear creation keys get VECTOR handles; BEZIER, SINE, QUAD, etc. use AUTO handles
+        creation_interpolation = _INTERPOLATION_VALUES[creation_ease_type]
+        creation_handle = _HANDLE_VALUES['VECTOR' if creation_ease_type == 'LINEAR' else 'AUTO']
         
         explode_animation_enabled = props.explode_animation_enabled
         explode_animation_duration = props.explode_animation_duration
@@ -165,364 +367,338 @@ class CSV_OT_GeneratePieChart(bpy.types.Operator):
             self.report({'ERROR'}, "Please select a CSV file.")
             return {'CANCELLED'}
 
-        data = []
         try:
-            with open(csv_file_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                if label_col_name not in reader.fieldnames or value_col_name not in reader.fieldnames:
-                    self.report({'ERROR'}, f"Column names not found. Available: {', '.join(reader.fieldnames)}")
-                    return {'CANCELLED'}
-
-                for row in reader:
-                    try:
-                        label = row[label_col_name]
-                        value = float(row[value_col_name])
-                        if value < 0:
-                            self.report({'WARNING'}, f"Skipping negative value: {value} for label {label}")
-                            continue
-                        data.append({'label': label, 'value': value})
-                    except ValueError:
-                        self.report({'WARNING'}, f"Skipping non-numeric value: '{row[value_col_name]}' for label '{row[label_col_name]}'")
-                    except KeyError as e:
-                        self.report({'ERROR'}, f"Missing column in row: {e}. Check column names.")
-                        return {'CANCELLED'}
-
+            labels, values, warnings = _prepare_slices(csv_file_path, os.path.getmtime(csv_file_path),
+                                                       label_col_name, value_col_name, sort_by)
         except FileNotFoundError:
             self.report({'ERROR'}, f"File not found: {csv_file_path}")
             return {'CANCELLED'}
+        except _SliceDataError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
         except Exception as e:
             self.report({'ERROR'}, f"Error reading CSV: {e}")
             return {'CANCELLED'}
 
-        if not data:
+        for warning in warnings:
+            self.report({'WARNING'}, warning)
+
+        if not len(values):
             self.report({'ERROR'}, "No valid data found in CSV to create pie chart.")
             return {'CANCELLED'}
 
-        total_value = sum(item['value'] for item in data)
+        total_value = values.sum()
         if total_value == 0:
             self.report({'ERROR'}, "Total value of data is zero. Cannot create pie chart.")
             return {'CANCELLED'}
 
-        # --- Sort Data based on user selection ---
-        if sort_by == 'VALUE_DESCENDING':
-            data.sort(key=lambda x: x['value'], reverse=True)
-        elif sort_by == 'LABEL_ASCENDING':
-            data.sort(key=lambda x: x['label'])
+        percentages = values / total_value
+        slice_count = len(values)
 
         # --- Scene Setup ---
         self.setup_scene(context, camera_distance, light_power)
 
         # Create a new collection for the pie chart objects
+        # The chart is built while its collection is detached from the scene, then attached once
+        # at the end so the view layer sees the finished chart as a single addition
+        scene_children = context.scene.collection.children
         pie_chart_collection_name = "CSV_Pie_Chart"
         if pie_chart_collection_name in bpy.data.collections:
             pie_collection = bpy.data.collections[pie_chart_collection_name]
-            # Clear existing objects in the collection
+            # A collection the user nested elsewhere stays where it is
+            attach_collection = pie_collection.name in scene_children
+            if attach_collection:
+                scene_children.unlink(pie_collection)
+            # Clear existing objects in the collection, returning their meshes and text
+            # curves to the pools so this run rewrites them instead of allocating new ones
+            old_data = {obj.data.name: obj.data for obj in pie_collection.objects if obj.data is not None}
             for obj in list(pie_collection.objects):
                 bpy.data.objects.remove(obj, do_unlink=True)
+            for block in old_data.values():
+                if block.users:
+                    continue
+                if isinstance(block, bpy.types.Mesh):
+                    block.clear_geometry()
+                    block.materials.clear()
+                    _MESH_POOL.append(block.name)
+                elif isinstance(block, bpy.types.TextCurve):
+                    _CURVE_POOL.append(block.name)
         else:
             pie_collection = bpy.data.collections.new(pie_chart_collection_name)
-            bpy.context.scene.collection.children.link(pie_collection)
+            attach_collection = True
 
         # Create a parent empty for the entire pie chart for rotation animation
         # This empty will also serve as the common origin for all slices/labels
-        bpy.ops.object.empty_add(type='PLAIN_AXES', location=(0, 0, 0))
-        chart_parent_empty = bpy.context.active_object
-        chart_parent_empty.name = "PieChart_Parent"
-        pie_collection.objects.link(chart_parent_empty)
-        bpy.context.collection.objects.unlink(chart_parent_empty) # Unlink from scene collection
+        chart_parent_empty = bpy.data.objects.new("PieChart_Parent", None)
+        chart_parent_empty.empty_display_type = 'PLAIN_AXES'
+
+        # All chart objects are parented first and linked to the collection in one pass at the end
+        new_objs = [chart_parent_empty]
+
+        # Slices with (nearly) the same angle share one wedge mesh spanning [0, angle];
+        # each slice object is then rotated into place around the chart center.
+        arc_count = segment_subdivisions + 1
+        slice_angles = percentages * (2 * math.pi)
+        slice_starts = np.concatenate(([0.0], np.cumsum(slice_angles)[:-1]))
+        wedge_angles, slice_wedge = np.unique(np.round(slice_angles, 4), return_inverse=True)
+
+        # Mid angles of every slice (for label placement and explode direction)
+        mid_angles = slice_starts + slice_angles * 0.5
+        mid_cos = np.cos(mid_angles)
+        mid_sin = np.sin(mid_angles)
+
+        # Label positions sit just outside the pie, slightly above the middle of the slice height.
+        # Labels are either always horizontal or radial
+        label_locations = np.empty((slice_count, 3))
+        label_locations[:, 0] = (pie_radius + text_offset) * mid_cos
+        label_locations[:, 1] = (pie_radius + text_offset) * mid_sin
+        label_locations[:, 2] = pie_height / 2 + 0.01
+        label_rotations_z = np.zeros(slice_count) if label_horizontal_orientation else mid_angles + math.pi / 2
+
+        # Final exploded position of every slice, relative to the parent empty
+        exploded_locations = np.zeros((slice_count, 3))
+        exploded_locations[:, 0] = pie_radius * explode_factor * mid_cos
+        exploded_locations[:, 1] = pie_radius * explode_factor * mid_sin
+
+        # Plain Python floats are cheaper to hand to RNA than NumPy scalars
+        label_locations = label_locations.tolist()
+        label_rotations_z = label_rotations_z.tolist()
+        exploded_locations = exploded_locations.tolist()
+
+        # One shared material for all slices; each slice carries its color as obj.color (RGBA)
+        slice_material = _slice_material()
+        slice_colors = np.hstack((_golden_palette(slice_count), np.ones((slice_count, 1)))).tolist()
+
+        # Shared cos/sin table for every wedge's arc, evaluated in a single pass
+        arc_theta = wedge_angles[:, None] * np.linspace(0.0, 1.0, arc_count)
+        arc_cos = (pie_radius * np.cos(arc_theta)).astype(np.float32)
+        arc_sin = (pie_radius * np.sin(arc_theta)).astype(np.float32)
+
+        wedge_meshes = [
+            self.build_wedge_mesh(f"PieWedge_{wedge_angle:.4f}", wedge_angle, arc_cos[w], arc_sin[w], pie_height,
+                                  segment_subdivisions, slice_material)
+            for w, wedge_angle in enumerate(wedge_angles)
+        ]
+
+        # --- Animation Schedule ---
+        # Every slice's start/end frames are computed up front. The frame properties are
+        # floats, so the schedule is kept as float arrays
+        current_frame = bpy.context.scene.frame_current
+        explode_active = explode_animation_enabled and explode_factor > 0
+        slice_idx = np.arange(slice_count)
+
+        creation_start_frames = current_frame + slice_idx * animation_offset
+        creation_end_frames = creation_start_frames + animation_duration
+
+        # If creation animation is also enabled, explode starts after it, plus the per-slice delay
+        explode_start_frames = (creation_end_frames if animate_creation else np.full(slice_count, float(current_frame)))
+        explode_start_frames = explode_start_frames + slice_idx * explode_animation_delay
+        explode_end_frames = explode_start_frames + explode_animation_duration
 
-        start_angle = 0
-        
         # Calculate overall animation end frame for scene frame_end
-        max_animation_end_frame = bpy.context.scene.frame_current
+        max_animation_end_frame = current_frame
 
         # End frame for creation animation (if enabled)
         if animate_creation:
-            max_animation_end_frame_creation = bpy.context.scene.frame_current + len(data) * animation_offset + animation_duration
+            max_animation_end_frame_creation = current_frame + slice_count * animation_offset + animation_duration
             max_animation_end_frame = max(max_animation_end_frame, max_animation_end_frame_creation)
 
-        # End frame for explode animation (if enabled)
-        if explode_animation_enabled and props.explode_factor > 0:
-            # Calculate the start frame for the LAST slice's explode animation
-            latest_explode_start_frame = bpy.context.scene.frame_current
-            if animate_creation:
-                latest_explode_start_frame += (len(data) - 1) * animation_offset + animation_duration
-            latest_explode_start_frame += (len(data) - 1) * explode_animation_delay
-            
-            max_animation_end_frame_explode = latest_explode_start_frame + explode_animation_duration
-            max_animation_end_frame = max(max_animation_end_frame, max_animation_end_frame_explode)
+        # End frame for explode animation (if enabled): the LAST slice finishes last
+        if explode_active:
+            max_animation_end_frame = max(max_animation_end_frame, float(explode_end_frames[-1]))
 
         # End frame for rotation animation (if enabled)
         if rotate_animation_enabled:
             # Rotation starts after all other animations finish, plus a small buffer
             rotate_start_frame = max_animation_end_frame + 10 
-            total_rotation_frames = abs(props.rotate_loops * 360 / props.rotate_speed) if props.rotate_speed != 0 else 1 # Avoid division by zero
+            total_rotation_frames = abs(rotate_loops * 360 / rotate_speed) if rotate_speed != 0 else 1 # Avoid division by zero
             max_animation_end_frame_rotate = rotate_start_frame + total_rotation_frames
             max_animation_end_frame = max(max_animation_end_frame, max_animation_end_frame_rotate)
 
         # Set scene frame end to encompass all animations
         bpy.context.scene.frame_end = int(max_animation_end_frame + 10) # Add some buffer
 
-        for i, item in enumerate(data):
-            percentage = item['value'] / total_value
-            angle = percentage * 2 * math.pi # Angle in radians for the slice
-
-            # Create the pie slice mesh
-            verts = []
-            faces = []
-
-            # Center vertex for the base and top
-            verts.append(Vector((0, 0, 0))) # Base center (index 0)
-            verts.append(Vector((0, 0, pie_height))) # Top center (index 1)
-
-            # Vertices for the base and top circumference
-            base_start_idx = len(verts)
-            for j in range(segment_subdivisions + 1):
-                theta = start_angle + (j / segment_subdivisions) * angle
-                x = pie_radius * math.cos(theta)
-                y = pie_radius * math.sin(theta)
-                verts.append(Vector((x, y, 0))) # Base circumference
-                verts.append(Vector((x, y, pie_height))) # Top circumference
-
-            # Create faces
-            # Base face
-            base_face_verts = [0] + [base_start_idx + k*2 for k in range(segment_subdivisions + 1)][::-1] # Reverse for correct normal
-            faces.append(base_face_verts)
-
-            # Top face
-            top_face_verts = [1] + [base_start_idx + k*2 + 1 for k in range(segment_subdivisions + 1)]
-            faces.append(top_face_verts)
-
-            # Side faces
-            for j in range(segment_subdivisions):
-                v0 = base_start_idx + j*2
-                v1 = base_start_idx + j*2 + 1
-                v2 = base_start_idx + (j+1)*2 + 1
-                v3 = base_start_idx + (j+1)*2
-                faces.append([v0, v1, v2, v3])
-
-            # Inner and outer radial faces (if not a full circle)
-            if angle < 2 * math.pi - 0.001: # Avoid adding these for a full circle
-                # Inner radial face (at start_angle)
-                faces.append([0, 1, base_start_idx + 1, base_start_idx])
-                # Outer radial face (at start_angle + angle)
-                faces.append([0, base_start_idx + segment_subdivisions*2, base_start_idx + segment_subdivisions*2 + 1, 1])
-
-
-            mesh_name = f"PieSlice_{item['label'].replace(' ', '_')}"
-            mesh = bpy.data.meshes.new(mesh_name)
-            mesh.from_pydata(verts, [], faces)
-            mesh.update()
+        creation_start_frames = creation_start_frames.tolist()
+        explode_start_frames = explode_start_frames.tolist()
+        explode_end_frames = explode_end_frames.tolist()
 
-            obj = bpy.data.objects.new(mesh_name, mesh)
-            pie_collection.objects.link(obj)
-            obj.parent = chart_parent_empty # Parent to the main chart empty
+        # All labels and the title reference one Font datablock for Blender's built-in font
+        shared_font = bpy.data.fonts.load("<builtin>", check_existing=True)
 
-            # Set a random color for the slice
-            mat_name = f"SliceMaterial_{item['label'].replace(' ', '_')}"
-            if mat_name in bpy.data.materials:
-                mat = bpy.data.materials[mat_name]
-            else:
-                mat = bpy.data.materials.new(name=mat_name)
-                mat.diffuse_color = (random.uniform(0.1, 0.9), random.uniform(0.1, 0.9), random.uniform(0.1, 0.9), 1.0)
-            
-            if obj.data.materials:
-                obj.data.materials[0] = mat
-            else:
-                obj.data.materials.append(mat)
+        # Every slice, label and the title grow with the same scale curve, so it lives in one
+        # shared action that each object plays from its own start frame through an NLA strip
+        creation_action = None
+        if animate_creation:
+            old_action = bpy.data.actions.get("PieChart_Create")
+            if old_action is not None and not old_action.users:
+                bpy.data.actions.remove(old_action)
+            creation_action = bpy.data.actions.new("PieChart_Create")
+            _add_key_pairs(creation_action, "scale", 0.0, animation_duration, (0.001,) * 3, (1.0,) * 3)
+            _apply_ease(creation_action, 'scale', creation_interpolation, creation_handle)
+
+        # Loop-invariant lookups bound once for the slice loop
+        new_object = bpy.data.objects.new
+        add_new_obj = new_objs.append
+        upright_x = math.radians(90)
+        slice_starts = slice_starts.tolist()
+        slice_wedge = slice_wedge.tolist()
+        slice_labels = labels.tolist() # Plain str/float, so the loop doesn't box NumPy scalars
+        slice_percentages = percentages.tolist()
+
+        for i, (label, percentage) in enumerate(zip(slice_labels, slice_percentages)):
+            safe_label = label.replace(' ', '_')
+            obj = new_object(f"PieSlice_{safe_label}", wedge_meshes[slice_wedge[i]])
+            add_new_obj(obj)
+            obj.parent = chart_parent_empty # Parent to the main chart empty
+            obj.rotation_euler.z = slice_starts[i] # Rotate the shared wedge into place
 
-            # Initial position of the slice (un-exploded, relative to parent empty)
-            obj.location = Vector((0, 0, 0))
-            
-            # Add text label
-            mid_angle = start_angle + angle / 2
-            text_x = (pie_radius + text_offset) * math.cos(mid_angle)
-            text_y = (pie_radius + text_offset) * math.sin(mid_angle)
-
-            # Set Z-location explicitly slightly above the pie slice to ensure visibility
-            label_z_location = pie_height / 2 + 0.01 # Slightly above the middle of the slice height
-
-            bpy.ops.object.text_add(enter_editmode=False, location=(text_x, text_y, label_z_location))
-            text_obj = bpy.context.active_object
-            text_obj.data.body = f"{item['label']} ({percentage:.1%})"
-            text_obj.data.size = text_size
-            text_obj.data.align_x = 'CENTER'
-            text_obj.data.align_y = 'CENTER' 
-
-            # Apply label orientation
-            if label_horizontal_orientation:
-                text_obj.rotation_euler.z = math.radians(0) # Always horizontal
-            else:
-                text_obj.rotation_euler.z = mid_angle + math.pi / 2 # Radial
+            obj.color = slice_colors[i] # Distinct color for the slice, read by the shared material
 
-            text_obj.rotation_euler.x = math.radians(90) # Make text stand upright
+            # New objects start at the origin, i.e. the un-exploded position relative to the parent empty
 
-            # Link text object to the pie chart collection and parent to the main chart empty
-            pie_collection.objects.link(text_obj)
-            bpy.context.collection.objects.unlink(text_obj) # Unlink from current collection
+            # Add text label. The X rotation makes text stand upright
+            text_obj = _make_text(f"PieLabel_{safe_label}", f"{label} ({percentage:.1%})", text_size,
+                                  label_locations[i], (upright_x, 0.0, label_rotations_z[i]), shared_font)
             text_obj.parent = chart_parent_empty # Parent to the main chart empty
+            add_new_obj(text_obj)
 
 
             # --- Animation Logic ---
-            current_frame = bpy.context.scene.frame_current
-
             # 1. Creation Animation (Scale)
             if animate_creation:
-                start_frame_creation = current_frame + i * animation_offset
-                end_frame_creation = start_frame_creation + animation_duration
-
-                obj.scale = Vector((0.001, 0.001, 0.001))
-                obj.keyframe_insert(data_path="scale", frame=start_frame_creation)
-                text_obj.scale = Vector((0.001, 0.001, 0.001))
-                text_obj.keyframe_insert(data_path="scale", frame=start_frame_creation)
-
-                obj.scale = Vector((1.0, 1.0, 1.0))
-                obj.keyframe_insert(data_path="scale", frame=end_frame_creation)
-                text_obj.scale = Vector((1.0, 1.0, 1.0))
-                text_obj.keyframe_insert(data_path="scale", frame=end_frame_creation)
-
-                # Set interpolation for creation animation
-                if obj.animation_data and obj.animation_data.action:
-                    for fcurve in obj.animation_data.action.fcurves:
-                        if fcurve.data_path.startswith('scale'): # Apply to all scale components
-                            for kp in fcurve.keyframe_points:
-                                kp.interpolation = creation_ease_type
-                                # Set handle types based on the interpolation type chosen
-                                if creation_ease_type == 'LINEAR':
-                                    kp.handle_left_type = 'VECTOR'
-                                    kp.handle_right_type = 'VECTOR'
-                                else: # For BEZIER, SINE, QUAD, etc., use AUTO handles
-                                    kp.handle_left_type = 'AUTO'
-                                    kp.handle_right_type = 'AUTO'
-                
-                if text_obj.animation_data and text_obj.animation_data.action:
-                    for fcurve in text_obj.animation_data.action.fcurves:
-                        if fcurve.data_path.startswith('scale'): # Apply to all scale components
-                            for kp in fcurve.keyframe_points:
-                                kp.interpolation = creation_ease_type
-                                if creation_ease_type == 'LINEAR':
-                                    kp.handle_left_type = 'VECTOR'
-                                    kp.handle_right_type = 'VECTOR'
-                                else:
-                                    kp.handle_left_type = 'AUTO'
-                                    kp.handle_right_type = 'AUTO'
+                _add_strip(obj, creation_action, creation_start_frames[i])
+                _add_strip(text_obj, creation_action, creation_start_frames[i])
 
             # 2. Explode Animation (Location)
-            # Calculate the final exploded position for this slice
-            final_exploded_location = Vector((
-                pie_radius * math.cos(mid_angle) * props.explode_factor,
-                pie_radius * math.sin(mid_angle) * props.explode_factor,
-                0
-            ))
-
-            if explode_animation_enabled and props.explode_factor > 0:
-                # Determine when this slice's explode animation should start
-                explode_animation_start_frame_for_this_slice = current_frame
-                if animate_creation: # If creation animation is also enabled, explode starts after it
-                    explode_animation_start_frame_for_this_slice = current_frame + i * animation_offset + animation_duration
-                
-                # Add the per-slice delay for explode animation
-                explode_animation_start_frame_for_this_slice += i * explode_animation_delay
-
-                explode_animation_end_frame_for_this_slice = explode_animation_start_frame_for_this_slice + explode_animation_duration
+            final_exploded_location = exploded_locations[i]
 
+            if explode_active:
                 # Keyframe from (0,0,0) to final_exploded_location
-                # obj.location is already (0,0,0) from initial setup
-                obj.keyframe_insert(data_path="location", frame=explode_animation_start_frame_for_this_slice)
-                
+                _key_channels(obj, "location", explode_start_frames[i], explode_end_frames[i], (0.0,) * 3, final_exploded_location)
                 obj.location = final_exploded_location
-                obj.keyframe_insert(data_path="location", frame=explode_animation_end_frame_for_this_slice)
-
-                # Set interpolation for explode animation (e.g., EASE_IN_OUT)
-                if obj.animation_data and obj.animation_data.action:
-                    for fcurve in obj.animation_data.action.fcurves:
-                        if fcurve.data_path.startswith('location'): # Apply to all location components
-                            for kp in fcurve.keyframe_points:
-                                kp.interpolation = 'BEZIER' # Use Bezier for smoother movement
-                                kp.handle_left_type = 'AUTO'
-                                kp.handle_right_type = 'AUTO'
-
-            elif not explode_animation_enabled and props.explode_factor > 0:
-                # If explode animation is NOT enabled but explode_factor is > 0, set instantly
+
+                # Set interpolation for explode animation: Bezier for smoother movement
+                _apply_ease(obj.animation_data.action, 'location', _INTERPOLATION_VALUES['BEZIER'], _HANDLE_VALUES['AUTO'])
+
+            elif explode_factor > 0:
+                # Explode animation is NOT enabled, so move the slice out instantly
                 obj.location = final_exploded_location
             # Else (explode_factor is 0), obj.location remains (0,0,0) as initialized
 
-
-            start_angle += angle
         
         # 3. Rotate Animation (on chart_parent_empty)
         if rotate_animation_enabled:
-            rotate_start_frame = bpy.context.scene.frame_current
+            rotate_start_frame = current_frame
             # If other animations are present, start rotation after they finish, plus a small buffer
-            if animate_creation or (explode_animation_enabled and props.explode_factor > 0):
+            if animate_creation or explode_active:
                 rotate_start_frame = max_animation_end_frame + 10 # Start after all other animations + buffer
 
             total_rotation_degrees = rotate_loops * 360
             # Ensure rotate_speed is not zero to avoid division by zero
             total_rotation_frames = abs(total_rotation_degrees / rotate_speed) if rotate_speed != 0 else 1 
 
-            chart_parent_empty.rotation_euler = Euler((0, 0, 0), 'XYZ')
-            chart_parent_empty.keyframe_insert(data_path="rotation_euler", index=2, frame=rotate_start_frame) # Z-axis rotation
-
             chart_parent_empty.rotation_euler = Euler((0, 0, math.radians(total_rotation_degrees)), 'XYZ')
-            chart_parent_empty.keyframe_insert(data_path="rotation_euler", index=2, frame=rotate_start_frame + total_rotation_frames)
+            _key_channels(chart_parent_empty, "rotation_euler", rotate_start_frame, rotate_start_frame + total_rotation_frames,
+                          (0.0,), (math.radians(total_rotation_degrees),), first_index=2) # Z-axis rotation
 
             # Set interpolation to linear for continuous rotation
             if chart_parent_empty.animation_data and chart_parent_empty.animation_data.action:
                 fcurves_rot = chart_parent_empty.animation_data.action.fcurves.find('rotation_euler', index=2)
                 if fcurves_rot:
-                    for kp in fcurves_rot.keyframe_points:
-                        kp.interpolation = 'LINEAR'
+                    fcurves_rot.keyframe_points.foreach_set("interpolation", [_INTERPOLATION_VALUES['LINEAR']] * len(fcurves_rot.keyframe_points))
         
         # --- Add Chart Title ---
         if chart_title:
             # Set Z-location explicitly slightly above the pie chart
             title_z_location = pie_height + text_size * 2 + 0.01
-            bpy.ops.object.text_add(enter_editmode=False, location=(0, 0, title_z_location))
-            title_obj = bpy.context.active_object
-            title_obj.data.body = chart_title
-            title_obj.data.size = text_size * 1.5
-            title_obj.data.align_x = 'CENTER'
-            title_obj.data.align_y = 'CENTER'
-            title_obj.rotation_euler.x = math.radians(90)
-            pie_collection.objects.link(title_obj)
-            bpy.context.collection.objects.unlink(title_obj)
+            title_obj = _make_text("PieChart_Title", chart_title, text_size * 1.5,
+                                   (0, 0, title_z_location), (math.radians(90), 0.0, 0.0), shared_font)
+            new_objs.append(title_obj)
             title_obj.parent = chart_parent_empty # Parent to the main chart empty
 
             # Animation for title
             if animate_creation:
-                title_obj.scale = Vector((0.001, 0.001, 0.001))
                 # Title animation starts after all slices have begun their animation
-                title_obj.keyframe_insert(data_path="scale", frame=current_frame + len(data) * animation_offset)
-                title_obj.scale = Vector((1.0, 1.0, 1.0))
-                title_obj.keyframe_insert(data_path="scale", frame=current_frame + len(data) * animation_offset + animation_duration)
-                
-                # Set interpolation for title creation animation
-                if title_obj.animation_data and title_obj.animation_data.action:
-                    for fcurve in title_obj.animation_data.action.fcurves:
-                        if fcurve.data_path.startswith('scale'): # Apply to all scale components
-                            for kp in fcurve.keyframe_points:
-                                kp.interpolation = creation_ease_type
-                                if creation_ease_type == 'LINEAR':
-                                    kp.handle_left_type = 'VECTOR'
-                                    kp.handle_right_type = 'VECTOR'
-                                else:
-                                    kp.handle_left_type = 'AUTO'
-                                    kp.handle_right_type = 'AUTO'
+                _add_strip(title_obj, creation_action, current_frame + slice_count * animation_offset)
+
 
+        # Derive edges and normals for the wedge meshes once the whole chart is built
+        for mesh in wedge_meshes:
+            mesh.update(calc_edges=True)
+
+        # Link the finished object graph in one pass, attach the chart, then resync the view layer once
+        for obj in new_objs:
+            pie_collection.objects.link(obj)
+        if attach_collection:
+            scene_children.link(pie_collection)
+        context.view_layer.update()
 
         self.report({'INFO'}, "Pie chart and scene generated successfully!")
         return {'FINISHED'}
 
+    def build_wedge_mesh(self, mesh_name, angle, arc_x, arc_y, pie_height, segment_subdivisions, material):
+        """Builds a pie wedge mesh spanning [0, angle] from precomputed arc coordinates.
+
+        The caller is responsible for calling mesh.update(calc_edges=True) afterwards.
+        """
+        arc_count = segment_subdivisions + 1
+
+        # Center vertices for the base (index 0) and top (index 1), followed by
+        # interleaved base/top circumference vertices
+        verts = np.zeros((2 + 2 * arc_count, 3), dtype=np.float32)
+        verts[1, 2] = pie_height
+        base_start_idx = 2
+        circ = verts[base_start_idx:]
+        circ[0::2, 0] = arc_x
+        circ[0::2, 1] = arc_y
+        circ[1::2, 0] = arc_x
+        circ[1::2, 1] = arc_y
+        circ[1::2, 2] = pie_height
+
+        base_ring = base_start_idx + 2 * np.arange(arc_count)
+        top_ring = base_ring + 1
+
+        # Create faces as flat loop buffers
+        face_loops = [
+            np.concatenate(([0], base_start_idx + 2 * np.arange(segment_subdivisions, -1, -1))), # Base face, reversed for correct normal
+            np.concatenate(([1], top_ring)), # Top face
+            np.stack([base_ring[:-1], top_ring[:-1], top_ring[1:], base_ring[1:]], axis=1).ravel(), # Side faces
+        ]
+        face_lengths = [arc_count + 1, arc_count + 1] + [4] * segment_subdivisions
+
+        # Inner and outer radial faces (if not a full circle)
+        if angle < 2 * math.pi - 0.001: # Avoid adding these for a full circle
+            face_loops.append(np.array([
+                0, 1, base_start_idx + 1, base_start_idx, # Inner radial face (at angle 0)
+                0, base_start_idx + segment_subdivisions*2, base_start_idx + segment_subdivisions*2 + 1, 1, # Outer radial face (at angle)
+            ]))
+            face_lengths += [4, 4]
+
+        loop_vertex_indices = np.concatenate(face_loops).astype(np.int32)
+        loop_totals = np.array(face_lengths, dtype=np.int32)
+        loop_starts = np.zeros_like(loop_totals)
+        np.cumsum(loop_totals[:-1], dtype=np.int32, out=loop_starts[1:])
+
+        mesh = _take_pooled(_MESH_POOL, bpy.data.meshes, mesh_name)
+        if mesh is None:
+            mesh = bpy.data.meshes.new(mesh_name)
+        mesh.vertices.add(len(verts))
+        mesh.vertices.foreach_set("co", verts.ravel())
+        mesh.loops.add(len(loop_vertex_indices))
+        mesh.loops.foreach_set("vertex_index", loop_vertex_indices)
+        mesh.polygons.add(len(loop_totals))
+        mesh.polygons.foreach_set("loop_start", loop_starts)
+        if bpy.app.version < (4, 0, 0): # loop_total is derived from loop_start in Blender 4.0+
+            mesh.polygons.foreach_set("loop_total", loop_totals)
+        mesh.materials.append(material)
+        return mesh
+
     def setup_scene(self, context, camera_distance, light_power): 
-        # Clear existing cameras
-        for obj in bpy.data.objects:
-            if obj.type == 'CAMERA':
-                bpy.data.objects.remove(obj, do_unlink=True)
-        # Clear existing lights
-        for obj in bpy.data.objects:
-            if obj.type == 'LIGHT':
-                bpy.data.objects.remove(obj, do_unlink=True)
+        # Clear existing cameras and lights in one batch, together with the camera/light
+        # datablocks that only they use (these would otherwise be left as orphans)
+        old_objects = [obj for obj in bpy.data.objects if obj.type in {'CAMERA', 'LIGHT'}]
+        old_data = [obj.data for obj in old_objects if obj.data and obj.data.users == 1]
+        bpy.data.batch_remove(ids=old_objects + old_data)
 
         # --- Camera Setup ---
         cam_data = bpy.data.cameras.new("PieChartCam")
@@ -531,9 +707,10 @@ class CSV_OT_GeneratePieChart(bpy.types.Operator):
 
         cam_obj.location = (0, -camera_distance, camera_distance * 0.75)
         
-        direction = Vector((0,0,0)) - cam_obj.location
-        rot_quat = direction.to_track_quat('-Z', 'Y')
-        cam_obj.rotation_euler = rot_quat.to_euler()
+        # The camera always looks at the origin from (0, -d, 0.75d). A pure X rotation by
+        # theta points its -Z axis along (0, sin(theta), -cos(theta)), so matching the
+        # direction (0, d, -0.75d) gives tan(theta) = 1 / 0.75, independent of d.
+        cam_obj.rotation_euler = (math.atan2(1.0, 0.75), 0.0, 0.0)
 
         context.scene.camera = cam_obj
 
@@ -840,6 +1017,10 @@ def unregister():
     # Check if the pointer property exists before deleting
     if hasattr(bpy.types.Scene, 'csv_pie_chart_props'):
         del bpy.types.Scene.csv_pie_chart_props
+    # Drop cached CSV data so a reloaded add-on starts fresh
+    _CSV_CACHE.clear()
+    _prepare_slices.cache_clear()
+    _golden_palette.cache_clear()
 
 if __name__ == "__main__":
     register()
@@ -1,9 +1,86 @@
 import bpy
+import bmesh
 import csv
 import os
+import numpy as np
 import mathutils # For color operations
 import math # Import the math module for math.radians
 
+_CSV_CACHE = {}
+
+def _load_columns(csv_file_path, col_indices):
+    """Returns (header, columns, row_lengths) for the given columns of a CSV file.
+
+    columns maps each index within the header to a read-only string array of its cells ('' where
+    a row is too short). Columns already parsed from the unchanged file are reused, so the file is
+    only read again when a run needs a column the previous runs did not.
+    """
+    key = (csv_file_path, os.stat(csv_file_path).st_mtime)
+    cached = _CSV_CACHE.get(key)
+    if cached is None:
+        _CSV_CACHE.clear() # Only keep the most recently read file
+        cached = _CSV_CACHE[key] = {"header": None, "row_lengths": None, "columns": {}}
+
+    parsed = cached["columns"]
+    missing = [col_idx for col_idx in set(col_indices) if col_idx not in parsed]
+    if cached["header"] is None or missing:
+        with open(csv_file_path, 'r') as csvfile:
+            reader = csv.reader(csvfile)
+            header = next(reader)
+
+            # Stream rows straight into the missing columns, so the file is never
+            # held in memory as a list of full rows
+            row_lengths = []
+            column_cells = [(col_idx, []) for col_idx in missing if col_idx < len(header)]
+            for row in reader:
+                row_length = len(row)
+                row_lengths.append(row_length)
+                for col_idx, cells in column_cells:
+                    cells.append(row[col_idx] if row_length > col_idx else '')
+
+        for col_idx, cells in column_cells:
+            cells = np.array(cells, dtype=str)
+            cells.flags.writeable = False # Shared by every run that reads this column
+            parsed[col_idx] = cells
+        row_lengths = np.array(row_lengths, dtype=np.int64)
+        row_lengths.flags.writeable = False
+        cached["header"], cached["row_lengths"] = header, row_lengths
+
+    columns = {col_idx: parsed[col_idx] for col_idx in set(col_indices) if col_idx in parsed}
+    return cached["header"], columns, cached["row_lengths"]
+
+# Deliberate duplicate of _to_float_array in "CSV pie chart.py": each add-on is a standalone file, so keep both copies in sync
+def _to_float_array(cells, dtype=np.float64):
+    """Converts a column of CSV cells to a float array, using NaN for non-numeric cells."""
+    try:
+        return np.array(cells, dtype=dtype) # Fast path: every cell is numeric
+    except ValueError:
+        # Dirty columns tend to repeat the same few bad cells, so each distinct cell is parsed only once
+        uniques, inverse = np.unique(cells, return_inverse=True)
+        unique_values = np.full(len(uniques), np.nan, dtype=dtype)
+        for i, cell in enumerate(uniques.tolist()):
+            try:
+                unique_values[i] = float(cell)
+            except ValueError:
+                pass
+        return unique_values[inverse]
+
+def _category_codes(cells):
+    """Maps each distinct cell to a numerical index, numbered in order of first appearance."""
+    uniques, first_index = np.unique(cells, return_index=True)
+    return {value: code for code, value in enumerate(uniques[np.argsort(first_index)].tolist())}
+
+def _category_positions(cells, category_map, spacing):
+    """Places each cell at its category index times spacing; cells without a category go to 0."""
+    uniques, inverse = np.unique(cells, return_inverse=True)
+    codes = np.array([category_map.get(value, 0) for value in uniques.tolist()], dtype=np.float32) # One lookup per distinct cell
+    return codes[inverse] * spacing
+
+# Labels stand upright, facing the front camera
+_LABEL_ROT = (math.pi / 2, 0.0, 0.0)
+# The isometric camera always sits at (+d, -d, +d) from the center, so it always looks along (-1, 1, -1)
+_ISOMETRIC_CAMERA_ROT = mathutils.Vector((-1.0, 1.0, -1.0)).to_track_quat('-Z', 'Y').to_euler()
+
 # --- Operator to Visualize CSV Data ---
 class CSV_OT_VisualizeData(bpy.types.Operator):
     """Visualize CSV data as 3D objects with options"""
@@ -89,6 +166,11 @@ class CSV_OT_VisualizeData(bpy.types.Operator):
         description="Choose the type of 3D primitive to visualize the data",
         default='CUBE'
     )
+    use_instancing: bpy.props.BoolProperty(
+        name="Use Instancing",
+        description="Draw all data points as Geometry Nodes instances on a single point cloud object instead of one object per row (much faster for large CSVs)",
+        default=False
+    )
     enable_color_mapping: bpy.props.BoolProperty(
         name="Enable Color Mapping",
         description="Color objects based on a data column",
@@ -158,14 +240,14 @@ class CSV_OT_VisualizeData(bpy.types.Operator):
     color_a: bpy.props.FloatVectorProperty(
         name="Color A",
         subtype='COLOR',
-        default=(0.2, 0.4, 0.8, 1.0), # Blue
-        min=0.0, max=1.0, size=4
+        default=(0.2, 0.4, 0.8), # Blue
+        min=0.0, max=1.0, size=3 # RGB; alpha is always opaque
     )
     color_b: bpy.props.FloatVectorProperty(
         name="Color B",
         subtype='COLOR',
-        default=(0.8, 0.2, 0.4, 1.0), # Reddish
-        min=0.0, max=1.0, size=4
+        default=(0.8, 0.2, 0.4), # Reddish
+        min=0.0, max=1.0, size=3 # RGB; alpha is always opaque
     )
 
     # New: Y-axis offset
@@ -179,214 +261,300 @@ class CSV_OT_VisualizeData(bpy.types.Operator):
 
     def _clear_previous_visualization(self, context):
         """Clears existing visualization objects, materials, cameras, and lights."""
+        old_objects = []
         if "CSV_Viz" in bpy.data.collections:
-            viz_collection = bpy.data.collections["CSV_Viz"]
-            for obj in list(viz_collection.objects):
-                bpy.data.objects.remove(obj, do_unlink=True)
-            if not viz_collection.objects:
-                bpy.data.collections.remove(viz_collection)
-        
-        for material in list(bpy.data.materials):
-            if material.name.startswith("CSV_Material_") or material.name.startswith("Alternating_Color_") or material.name == "CSV_Label_Material":
-                bpy.data.materials.remove(material)
+            old_objects.extend(bpy.data.collections["CSV_Viz"].objects)
 
+        # Cameras and lights replaced by the active presets, collected in a single scan
+        replaced_types = set()
         if self.camera_preset != 'NONE':
-            for obj in context.scene.objects:
-                if obj.type == 'CAMERA':
-                    bpy.data.objects.remove(obj, do_unlink=True)
+            replaced_types.add('CAMERA')
         if self.lighting_preset != 'NONE':
-            for obj in context.scene.objects:
-                if obj.type == 'LIGHT':
-                    bpy.data.objects.remove(obj, do_unlink=True)
+            replaced_types.add('LIGHT')
+        if replaced_types:
+            old_names = {obj.name for obj in old_objects}
+            old_objects.extend(obj for obj in context.scene.objects if obj.type in replaced_types and obj.name not in old_names)
+
+        # Remove all old objects in one pass, then the meshes, curves, cameras and lights
+        # that only they used (these would otherwise be left behind as orphans)
+        old_data = {(type(obj.data), obj.data.name): obj.data for obj in old_objects if obj.data is not None}
+        old_data.update(
+            ((type(mod.node_group), mod.node_group.name), mod.node_group) # Instancing node groups
+            for obj in old_objects for mod in obj.modifiers
+            if mod.type == 'NODES' and mod.node_group is not None
+        )
+        bpy.data.batch_remove(ids=old_objects)
+        if "CSV_Viz" in bpy.data.collections and not bpy.data.collections["CSV_Viz"].objects:
+            bpy.data.collections.remove(bpy.data.collections["CSV_Viz"])
+        
+        # Materials made by earlier runs carry the csv_viz tag (see _new_material)
+        stale_materials = [material for material in bpy.data.materials if material.get("csv_viz")]
+        bpy.data.batch_remove(ids=[data for data in old_data.values() if not data.users] + stale_materials)
 
-        # Ensure the collection exists for new objects
+        # Ensure the collection exists for new objects; execute links it to the scene once it is filled
         if "CSV_Viz" not in bpy.data.collections:
-            viz_collection = bpy.data.collections.new("CSV_Viz")
-            bpy.context.scene.collection.children.link(viz_collection)
+            bpy.data.collections.new("CSV_Viz")
         return bpy.data.collections["CSV_Viz"]
 
     def _load_and_validate_data(self):
-        """Loads CSV data and performs initial column validation."""
+        """Loads the CSV columns used by the visualization and performs initial column validation.
+
+        Returns (header, columns, row_lengths). columns maps each used column index to a string
+        array of its cells ('' where a row is too short); row_lengths holds each row's cell count.
+        """
         if not self.filepath or not os.path.exists(self.filepath):
             self.report({'ERROR'}, "Error: Please select a valid CSV file.")
-            return None, None
+            return None, None, None
+
+        required_cols = [self.x_column, self.y_column]
+        if not self.z_is_constant:
+            required_cols.append(self.z_column)
+        if self.scale_column != -1:
+            required_cols.append(self.scale_column)
+        if self.enable_color_mapping:
+            required_cols.append(self.color_column)
 
         try:
-            with open(self.filepath, 'r') as csvfile:
-                reader = csv.reader(csvfile)
-                header = next(reader)
-                data_rows = list(reader)
-
-                num_columns = len(header)
-                required_cols = [self.x_column, self.y_column]
-                if not self.z_is_constant:
-                    required_cols.append(self.z_column)
-                if self.scale_column != -1:
-                    required_cols.append(self.scale_column)
-                if self.enable_color_mapping:
-                    required_cols.append(self.color_column)
-
-                for col_name, col_idx in [
-                    ("X Column", self.x_column),
-                    ("Y Column", self.y_column),
-                    ("Z Column", self.z_column if not self.z_is_constant else -1),
-                    ("Scale Column", self.scale_column if self.scale_column != -1 else -1),
-                    ("Color Column", self.color_column if self.enable_color_mapping else -1)
-                ]:
-                    if col_idx != -1 and col_idx >= num_columns:
-                        self.report({'ERROR'}, f"Error: {col_name} index ({col_idx}) is out of range. Your CSV has {num_columns} columns. Please check your column settings.")
-                        return None, None
-            return header, data_rows
+            header, columns, row_lengths = _load_columns(self.filepath, required_cols)
         except Exception as e:
             self.report({'ERROR'}, f"Error loading CSV file: {e}")
-            return None, None
-
-    def _preprocess_categorical_data(self, data_rows):
+            return None, None, None
+
+        num_columns = len(header)
+        for col_name, col_idx in [
+            ("X Column", self.x_column),
+            ("Y Column", self.y_column),
+            ("Z Column", self.z_column if not self.z_is_constant else -1),
+            ("Scale Column", self.scale_column if self.scale_column != -1 else -1),
+            ("Color Column", self.color_column if self.enable_color_mapping else -1)
+        ]:
+            if col_idx != -1 and col_idx >= num_columns:
+                self.report({'ERROR'}, f"Error: {col_name} index ({col_idx}) is out of range. Your CSV has {num_columns} columns. Please check your column settings.")
+                return None, None, None
+
+        return header, columns, row_lengths
+
+    def _preprocess_categorical_data(self, columns, row_lengths):
         """Builds maps for categorical data to numerical indices."""
         x_category_map = {}
         y_category_map = {}
         z_category_map = {}
-        x_cat_counter = 0
-        y_cat_counter = 0
-        z_cat_counter = 0
-
-        for i, row in enumerate(data_rows):
-            if len(row) <= max(self.x_column, self.y_column):
-                self.report({'WARNING'}, f"Warning: Row {i+2} skipped for categorical processing: Not enough columns for X/Y.")
-                continue
-
-            if self.x_is_categorical:
-                x_val = row[self.x_column]
-                if x_val not in x_category_map:
-                    x_category_map[x_val] = x_cat_counter
-                    x_cat_counter += 1
-            if self.y_is_categorical:
-                y_val = row[self.y_column]
-                if y_val not in y_category_map:
-                    y_category_map[y_val] = y_cat_counter
-                    y_cat_counter += 1
-            
-            if not self.z_is_constant and self.z_is_categorical:
-                if len(row) > self.z_column:
-                    z_val = row[self.z_column]
-                    if z_val not in z_category_map:
-                        z_category_map[z_val] = z_cat_counter
-                        z_cat_counter += 1
-                else:
-                    self.report({'WARNING'}, f"Warning: Row {i+2} skipped for Z-categorical processing: Missing Z column data.")
-        return x_category_map, y_category_map, z_category_map, x_cat_counter, y_cat_counter, z_cat_counter
-
-    def _calculate_color_range(self, data_rows):
+
+        usable = row_lengths > max(self.x_column, self.y_column)
+        if not usable.all():
+            skipped = np.flatnonzero(~usable)
+            self.report({'WARNING'}, f"Warning: {len(skipped)} row(s) skipped for categorical processing: Not enough columns for X/Y (first: row {skipped[0] + 2}).")
+
+        if self.x_is_categorical:
+            x_category_map = _category_codes(columns[self.x_column][usable])
+        if self.y_is_categorical:
+            y_category_map = _category_codes(columns[self.y_column][usable])
+        
+        if not self.z_is_constant and self.z_is_categorical:
+            missing_z = usable & (row_lengths <= self.z_column)
+            if missing_z.any():
+                self.report({'WARNING'}, f"Warning: {missing_z.sum()} row(s) skipped for Z-categorical processing: Missing Z column data (first: row {np.flatnonzero(missing_z)[0] + 2}).")
+            z_category_map = _category_codes(columns[self.z_column][usable & ~missing_z])
+        return x_category_map, y_category_map, z_category_map, len(x_category_map), len(y_category_map), len(z_category_map)
+
+    def _calculate_color_range(self, columns, row_lengths):
         """Calculates min/max values for color mapping."""
         min_color_val = float('inf')
         max_color_val = float('-inf')
-        valid_color_data_found = False
 
         if self.enable_color_mapping:
-            for i, row in enumerate(data_rows):
-                if len(row) > self.color_column:
-                    try:
-                        val = float(row[self.color_column])
-                        min_color_val = min(min_color_val, val)
-                        max_color_val = max(max_color_val, val)
-                        valid_color_data_found = True
-                    except ValueError:
-                        self.report({'WARNING'}, f"Warning: Row {i+2} skipped for color calculation: Non-numeric data in Color Column.")
-                else:
-                    self.report({'WARNING'}, f"Warning: Row {i+2} skipped for color calculation: Missing Color Column data.")
-
-            if not valid_color_data_found or max_color_val == float('-inf') or min_color_val == float('inf'):
+            color_vals = _to_float_array(columns[self.color_column])
+            valid = ~np.isnan(color_vals)
+            missing = row_lengths <= self.color_column
+            non_numeric = ~valid & ~missing
+            if non_numeric.any():
+                self.report({'WARNING'}, f"Warning: {non_numeric.sum()} row(s) skipped for color calculation: Non-numeric data in Color Column (first: row {np.flatnonzero(non_numeric)[0] + 2}).")
+            if missing.any():
+                self.report({'WARNING'}, f"Warning: {missing.sum()} row(s) skipped for color calculation: Missing Color Column data (first: row {np.flatnonzero(missing)[0] + 2}).")
+
+            if valid.any():
+                min_color_val = float(color_vals[valid].min())
+                max_color_val = float(color_vals[valid].max())
+            else:
                 self.report({'WARNING'}, "Warning: No valid numeric data found in the selected Color Column for mapping. Color mapping disabled.")
                 self.enable_color_mapping = False
         return min_color_val, max_color_val
 
-    def _create_primitive(self, location, scale):
-        """Creates a 3D primitive based on selected type and applies scale."""
+    def _create_template_mesh(self):
+        """Builds the primitive mesh once with bmesh; every data point object shares it."""
+        bm = bmesh.new()
+        bm.loops.layers.uv.new("UVMap") # Same UV map the primitive operators would create
+        # Same dimensions and resolution as the matching primitive_*_add operator defaults
         if self.primitive_type == 'CUBE':
-            bpy.ops.mesh.primitive_cube_add(size=1, enter_editmode=False, align='WORLD', location=location)
+            bmesh.ops.create_cube(bm, size=1.0, calc_uvs=True)
         elif self.primitive_type == 'SPHERE':
-            bpy.ops.mesh.primitive_uv_sphere_add(radius=0.5, enter_editmode=False, align='WORLD', location=location)
+            bmesh.ops.create_uvsphere(bm, u_segments=32, v_segments=16, radius=0.5, calc_uvs=True)
         elif self.primitive_type == 'CONE':
-            bpy.ops.mesh.primitive_cone_add(radius1=0.5, depth=1, enter_editmode=False, align='WORLD', location=location)
+            bmesh.ops.create_cone(bm, cap_ends=True, segments=32, radius1=0.5, radius2=0.0, depth=1.0, calc_uvs=True)
         elif self.primitive_type == 'CYLINDER':
-            bpy.ops.mesh.primitive_cylinder_add(radius=0.5, depth=1, enter_editmode=False, align='WORLD', location=location)
-        
-        obj = bpy.context.active_object
-        obj.scale = scale
+            bmesh.ops.create_cone(bm, cap_ends=True, segments=32, radius1=0.5, radius2=0.5, depth=1.0, calc_uvs=True)
+
+        template_mesh = bpy.data.meshes.new(f"CSV_{self.primitive_type}_Mesh")
+        bm.to_mesh(template_mesh)
+        bm.free()
+        template_mesh.materials.append(None) # Material slot, filled per object
+        return template_mesh
+
+    def _create_primitive(self, template_mesh, name):
+        """Creates a 3D primitive sharing the template mesh; its transform is written in bulk afterwards."""
+        obj = bpy.data.objects.new(name, template_mesh)
+        # The mesh is shared, so each object's material is linked to the object instead
+        obj.material_slots[0].link = 'OBJECT'
         return obj
 
-    def _apply_material(self, obj, data_index, color_val=None, min_color=None, max_color=None):
+    def _create_instance_node_group(self, material):
+        """Builds the Geometry Nodes tree that instances the primitive on every point of its input."""
+        node_group = bpy.data.node_groups.new("CSV_Instance_Points", 'GeometryNodeTree')
+        if hasattr(node_group, "interface"):
+            node_group.interface.new_socket("Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
+            node_group.interface.new_socket("Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
+        else: # Fallback for Blender versions before 4.0
+            node_group.inputs.new('NodeSocketGeometry', "Geometry")
+            node_group.outputs.new('NodeSocketGeometry', "Geometry")
+        nodes, links = node_group.nodes, node_group.links
+
+        group_input = nodes.new('NodeGroupInput')
+        group_input.location = (-600, 0)
+        group_output = nodes.new('NodeGroupOutput')
+        group_output.location = (400, 0)
+
+        # Same dimensions and resolution as the per-object template mesh
+        if self.primitive_type == 'CUBE':
+            primitive = nodes.new('GeometryNodeMeshCube')
+        elif self.primitive_type == 'SPHERE':
+            primitive = nodes.new('GeometryNodeMeshUVSphere')
+            primitive.inputs["Radius"].default_value = 0.5
+        elif self.primitive_type == 'CONE':
+            primitive = nodes.new('GeometryNodeMeshCone')
+            primitive.inputs["Radius Bottom"].default_value = 0.5
+            primitive.inputs["Depth"].default_value = 1.0
+        else:
+            primitive = nodes.new('GeometryNodeMeshCylinder')
+            primitive.inputs["Radius"].default_value = 0.5
+            primitive.inputs["Depth"].default_value = 1.0
+        primitive.location = (-600, -200)
+        instance_mesh = primitive.outputs["Mesh"]
+        if material is not None:
+            set_material = nodes.new('GeometryNodeSetMaterial')
+            set_material.location = (-400, -200)
+            set_material.inputs["Material"].default_value = material
+            links.new(instance_mesh, set_material.inputs["Geometry"])
+            instance_mesh = set_material.outputs["Geometry"]
+
+        scale_attribute = nodes.new('GeometryNodeInputNamedAttribute')
+        scale_attribute.location = (-400, -400)
+        scale_attribute.data_type = 'FLOAT_VECTOR'
+        scale_attribute.inputs["Name"].default_value = "csv_scale"
+
+        instance_on_points = nodes.new('GeometryNodeInstanceOnPoints')
+        instance_on_points.location = (100, 0)
+        links.new(group_input.outputs["Geometry"], instance_on_points.inputs["Points"])
+        links.new(instance_mesh, instance_on_points.inputs["Instance"])
+        links.new(scale_attribute.outputs["Attribute"], instance_on_points.inputs["Scale"])
+        links.new(instance_on_points.outputs["Instances"], group_output.inputs["Geometry"])
+        return node_group
+
+    def _create_instanced_points(self, viz_collection, locations, scales, colors):
+        """Creates one point cloud object whose Geometry Nodes modifier instances the primitive on each point.
+
+        colors is an (N, 4) array of per-point colors, or None for no material.
+        """
+        mesh = bpy.data.meshes.new("CSV_Points")
+        mesh.vertices.add(len(locations))
+        mesh.vertices.foreach_set("co", locations.ravel())
+        mesh.attributes.new("csv_scale", 'FLOAT_VECTOR', 'POINT').data.foreach_set("vector", scales.ravel())
+
+        material = None
+        if colors is not None:
+            mesh.attributes.new("csv_color", 'FLOAT_COLOR', 'POINT').data.foreach_set("color", colors.ravel())
+            # Instances carry the point colors; the material reads them back through the instancer
+            material_name = "CSV_Material_Instanced"
+            material = self._mat_cache.get(material_name)
+            if material is None:
+                material = self._new_material(material_name, (1.0, 1.0, 1.0, 1.0))
+                principled_node = material.node_tree.nodes.get("Principled BSDF")
+                if principled_node:
+                    color_attribute = material.node_tree.nodes.new("ShaderNodeAttribute")
+                    color_attribute.attribute_type = 'INSTANCER'
+                    color_attribute.attribute_name = "csv_color"
+                    color_attribute.location = (principled_node.location.x - 250, principled_node.location.y)
+                    material.node_tree.links.new(color_attribute.outputs["Color"], principled_node.inputs["Base Color"])
+        mesh.update()
+
+        points_obj = bpy.data.objects.new(f"CSV_{self.primitive_type}_Instances", mesh)
+        modifier = points_obj.modifiers.new("CSV_Instances", 'NODES')
+        modifier.node_group = self._create_instance_node_group(material)
+        viz_collection.objects.link(points_obj)
+        return points_obj
+
+    def _new_material(self, name, color):
+        """Creates a material with the given base color and caches it as one made by this run."""
+        mat = self._mat_cache[name] = bpy.data.materials.new(name=name)
+        mat["csv_viz"] = True # Lets the next clear find every material the visualizer made
+        mat.use_nodes = True
+        principled_node = mat.node_tree.nodes.get("Principled BSDF") # Looked up once, when the material is made
+        if principled_node:
+            principled_node.inputs['Base Color'].default_value = color
+        else:
+            mat.diffuse_color = color # Fallback for older Blender versions
+        return mat
+
+    def _apply_material(self, obj, data_index, color_mapped=False):
         """Applies material based on color mapping or alternating colors."""
-        if self.enable_color_mapping and min_color is not None and max_color is not None and max_color > min_color and color_val is not None:
-            try:
-                normalized_val = (color_val - min_color) / (max_color - min_color)
-                r, g, b, a = normalized_val, 0.0, 1.0 - normalized_val, 1.0 # Blue to Red gradient
-                
-                mat_name = f"CSV_Material_{data_index}"
-                mat = bpy.data.materials.new(name=mat_name)
-                mat.use_nodes = True
-                if mat.node_tree.nodes.get("Principled BSDF"):
-                    principled_node = mat.node_tree.nodes["Principled BSDF"]
-                    principled_node.inputs['Base Color'].default_value = (r, g, b, a)
-                else:
-                    mat.diffuse_color = (r, g, b, a)
-                
-                if obj.data.materials:
-                    obj.data.materials[0] = mat
-                else:
-                    obj.data.materials.append(mat)
-            except ValueError:
-                self.report({'WARNING'}, f"Warning: Object {obj.name} skipped for color: Non-numeric data in Color Column.")
-        elif self.enable_alternating_colors and self.primitive_type == 'CUBE':
-            mat_name = f"Alternating_Color_{data_index % 2}"
-            if mat_name not in bpy.data.materials:
-                mat = bpy.data.materials.new(name=mat_name)
-                mat.use_nodes = True
+        if color_mapped:
+            # One material for every mapped object; its Base Color comes from Object Info, i.e. obj.color
+            mat_name = "CSV_Material_Gradient"
+            mat = self._mat_cache.get(mat_name)
+            if mat is None:
+                mat = self._new_material(mat_name, (1.0, 1.0, 1.0, 1.0))
                 principled_node = mat.node_tree.nodes.get("Principled BSDF")
                 if principled_node:
-                    principled_node.inputs['Base Color'].default_value = self.color_a if data_index % 2 == 0 else self.color_b
-                else:
-                    mat.diffuse_color = self.color_a if data_index % 2 == 0 else self.color_b
-            else:
-                mat = bpy.data.materials[mat_name]
+                    object_info = mat.node_tree.nodes.new("ShaderNodeObjectInfo")
+                    object_info.location = (principled_node.location.x - 250, principled_node.location.y)
+                    mat.node_tree.links.new(object_info.outputs["Color"], principled_node.inputs["Base Color"])
             
-            if obj.data.materials:
-                obj.data.materials[0] = mat
-            else:
-                obj.data.materials.append(mat)
+            obj.material_slots[0].material = mat
+        elif self.enable_alternating_colors and self.primitive_type == 'CUBE':
+            mat_name = f"Alternating_Color_{data_index % 2}"
+            mat = self._mat_cache.get(mat_name) or bpy.data.materials.get(mat_name)
+            if mat is None:
+                mat = self._new_material(mat_name, (*(self.color_a if data_index % 2 == 0 else self.color_b), 1.0))
+            self._mat_cache[mat_name] = mat
+            
+            obj.material_slots[0].material = mat
 
     def _create_label(self, text, location, size, viz_collection):
         """Creates a text label object and ensures it's renderable."""
-        bpy.ops.object.text_add(enter_editmode=False, align='WORLD', location=location)
-        text_obj = bpy.context.active_object
-        text_obj.data.body = text
+        label_name = f"CSV_Label_{text}" # Give a more descriptive name
+        # Labels with the same text share one text curve, so each string is laid out once
+        text_curve = self._label_curves.get(text)
+        if text_curve is None:
+            text_curve = self._label_curves[text] = bpy.data.curves.new(label_name, type='FONT')
+            text_curve.body = text
+
+            # Assign a simple white material to the label
+            label_material_name = "CSV_Label_Material"
+            label_mat = self._mat_cache.get(label_material_name) or bpy.data.materials.get(label_material_name)
+            if label_mat is None:
+                label_mat = self._new_material(label_material_name, (1.0, 1.0, 1.0, 1.0)) # White color
+            self._mat_cache[label_material_name] = label_mat
+            
+            text_curve.materials.append(label_mat)
+
+        text_obj = bpy.data.objects.new(label_name, text_curve)
+        text_obj.location = location
         text_obj.scale = (size, size, size)
-        text_obj.rotation_euler = (mathutils.Euler((math.radians(90), 0, 0), 'XYZ'))
-        text_obj.name = f"CSV_Label_{text}" # Give a more descriptive name
+        text_obj.rotation_euler = _LABEL_ROT
 
         # Ensure label is visible in render
         text_obj.hide_render = False
 
-        # Assign a simple white material to the label
-        label_material_name = "CSV_Label_Material"
-        if label_material_name not in bpy.data.materials:
-            label_mat = bpy.data.materials.new(name=label_material_name)
-            label_mat.use_nodes = True
-            if label_mat.node_tree.nodes.get("Principled BSDF"):
-                principled_node = label_mat.node_tree.nodes["Principled BSDF"]
-                principled_node.inputs['Base Color'].default_value = (1.0, 1.0, 1.0, 1.0) # White color
-            else:
-                label_mat.diffuse_color = (1.0, 1.0, 1.0, 1.0) # Fallback for older Blender versions
-        else:
-            label_mat = bpy.data.materials[label_material_name]
-        
-        if text_obj.data.materials:
-            text_obj.data.materials[0] = label_mat
-        else:
-            text_obj.data.materials.append(label_mat)
-
         viz_collection.objects.link(text_obj)
-        bpy.context.collection.objects.unlink(text_obj)
         return text_obj
 
     def _create_axis_line(self, viz_collection, x_cat_counter, y_base_coord):
@@ -399,55 +567,52 @@ class CSV_OT_VisualizeData(bpy.types.Operator):
             obj = bpy.data.objects.new("X_Axis_Line", mesh)
             viz_collection.objects.link(obj)
 
-            verts = [(axis_start_x, 0, self.z_constant_value), (axis_end_x, 0, self.z_constant_value)]
-            edges = [(0, 1)]
-            mesh.from_pydata(verts, edges, [])
+            mesh.vertices.add(2)
+            mesh.vertices.foreach_set("co", np.array([axis_start_x, 0, self.z_constant_value,
+                                                      axis_end_x, 0, self.z_constant_value], dtype=np.float32))
+            mesh.edges.add(1)
+            mesh.edges.foreach_set("vertices", np.array([0, 1], dtype=np.int32))
             mesh.update()
 
             obj.location.y = y_base_coord # Apply y_base_coord to axis line
             obj.location.z = self.z_constant_value
+            return obj
+        return None
+
+    def setup_camera(self, context, viz_collection, primitive_bounds, extra_objects):
+        """Sets up the scene camera based on preset and the bounding box of the visualization.
 
-    def setup_camera(self, context, viz_collection):
-        """Sets up the scene camera based on preset and object bounding box."""
-        bpy.ops.object.camera_add(location=(0,0,0))
-        camera_obj = bpy.context.active_object
-        camera_obj.name = "CSV_Viz_Camera"
+        primitive_bounds is the (mins, maxs) box of the data point primitives, or None if none were
+        created; extra_objects are the labels and axis line, framed from their evaluated bounds.
+        """
+        camera_obj = bpy.data.objects.new("CSV_Viz_Camera", bpy.data.cameras.new("CSV_Viz_Camera"))
         viz_collection.objects.link(camera_obj)
-        bpy.context.collection.objects.unlink(camera_obj)
         context.scene.camera = camera_obj
 
-        min_x, max_x = float('inf'), float('-inf')
-        min_y, max_y = float('inf'), float('-inf')
-        min_z, max_z = float('inf'), float('-inf')
+        if primitive_bounds is not None:
+            mins, maxs = (bound.copy() for bound in primitive_bounds)
+        else:
+            mins, maxs = np.full(3, np.inf), np.full(3, -np.inf)
 
-        for obj in viz_collection.objects:
+        for obj in extra_objects:
             if obj.type == 'MESH':
-                bbox_corners = [obj.matrix_world @ mathutils.Vector(corner) for corner in obj.bound_box]
-                for corner in bbox_corners:
-                    min_x = min(min_x, corner.x)
-                    max_x = max(max_x, corner.x)
-                    min_y = min(min_y, corner.y)
-                    max_y = max(max_y, corner.y)
-                    min_z = min(min_z, corner.z)
-                    max_z = max(max_z, corner.z)
+                bbox_corners = np.array([obj.matrix_world @ mathutils.Vector(corner) for corner in obj.bound_box])
+                np.minimum(mins, bbox_corners.min(axis=0), out=mins)
+                np.maximum(maxs, bbox_corners.max(axis=0), out=maxs)
             elif obj.type == 'FONT':
                 if obj.dimensions.x > 0:
-                    text_center = obj.matrix_world.translation
-                    text_half_x = obj.dimensions.x / 2
-                    text_half_y = obj.dimensions.y / 2
-                    text_half_z = obj.dimensions.z / 2
-                    
-                    min_x = min(min_x, text_center.x - text_half_x)
-                    max_x = max(max_x, text_center.x + text_half_x)
-                    min_y = min(min_y, text_center.y - text_half_y)
-                    max_y = max(max_y, text_center.y + text_half_y)
-                    min_z = min(min_z, text_center.z - text_half_z)
-                    max_z = max(max_z, text_center.z + text_half_z)
-
-        if min_x == float('inf'):
+                    text_center = np.array(obj.matrix_world.translation)
+                    text_half = np.array(obj.dimensions) / 2
+                    np.minimum(mins, text_center - text_half, out=mins)
+                    np.maximum(maxs, text_center + text_half, out=maxs)
+
+        if not np.isfinite(mins[0]):
             self.report({'WARNING'}, "No objects found in CSV_Viz collection for camera framing.")
             return
 
+        min_x, min_y, min_z = mins.tolist()
+        max_x, max_y, max_z = maxs.tolist()
+
         center_x = (min_x + max_x) / 2
         center_y = (min_y + max_y) / 2
         center_z = (min_z + max_z) / 2
@@ -465,27 +630,22 @@ class CSV_OT_VisualizeData(bpy.types.Operator):
             camera_obj.rotation_euler = (0, 0, 0)
         elif self.camera_preset == 'ISOMETRIC':
             camera_obj.location = (center_x + max_dim * 1.5, center_y - max_dim * 1.5 + self.y_offset, center_z + max_dim * 1.5)
-            look_at = mathutils.Vector((center_x, center_y + self.y_offset, center_z))
-            camera_obj.rotation_euler = (look_at - camera_obj.location).to_track_quat('-Z', 'Y').to_euler()
+            camera_obj.rotation_euler = _ISOMETRIC_CAMERA_ROT
 
         camera_obj.data.clip_end = max_dim * 3
 
     def setup_lighting(self, context, viz_collection):
         """Sets up scene lighting based on preset."""
         if self.lighting_preset == 'SUN_LAMP':
-            bpy.ops.object.light_add(type='SUN', location=(5, -5 + self.y_offset, 10))
-            light_obj = bpy.context.active_object
-            light_obj.name = "CSV_Viz_Sun"
+            light_obj = bpy.data.objects.new("CSV_Viz_Sun", bpy.data.lights.new("CSV_Viz_Sun", type='SUN'))
+            light_obj.location = (5, -5 + self.y_offset, 10)
             light_obj.data.energy = 5
             viz_collection.objects.link(light_obj)
-            bpy.context.collection.objects.unlink(light_obj)
         elif self.lighting_preset == 'POINT_LAMP':
-            bpy.ops.object.light_add(type='POINT', location=(0, 0 + self.y_offset, 5))
-            light_obj = bpy.context.active_object
-            light_obj.name = "CSV_Viz_Point"
+            light_obj = bpy.data.objects.new("CSV_Viz_Point", bpy.data.lights.new("CSV_Viz_Point", type='POINT'))
+            light_obj.location = (0, 0 + self.y_offset, 5)
             light_obj.data.energy = 1000
             viz_collection.objects.link(light_obj)
-            bpy.context.collection.objects.unlink(light_obj)
 
     def execute(self, context):
         """Main execution logic for visualizing CSV data."""
@@ -525,98 +685,164 @@ class CSV_OT_VisualizeData(bpy.types.Operator):
         viz_collection = self._clear_previous_visualization(context)
 
         # 3. Load and validate data
-        header, data_rows = self._load_and_validate_data()
-        if data_rows is None: # Error occurred during loading/validation
+        header, columns, row_lengths = self._load_and_validate_data()
+        if columns is None: # Error occurred during loading/validation
             return {'CANCELLED'}
 
         # 4. Pre-process categorical data
-        x_category_map, y_category_map, z_category_map, x_cat_counter, _, _ = self._preprocess_categorical_data(data_rows)
+        x_category_map, y_category_map, z_category_map, x_cat_counter, _, _ = self._preprocess_categorical_data(columns, row_lengths)
 
         # 5. Calculate color range if color mapping is enabled
-        min_color_val, max_color_val = self._calculate_color_range(data_rows)
+        min_color_val, max_color_val = self._calculate_color_range(columns, row_lengths)
 
         # 6. Create objects based on data
-        y_base_coord = self.y_offset # Base Y coordinate for all objects
-
-        for i, row in enumerate(data_rows):
-            # Skip row if it doesn't have enough columns for the selected properties
-            current_row_max_col = max(self.x_column, self.y_column, 
-                                      self.scale_column if self.scale_column != -1 else 0,
-                                      self.color_column if self.enable_color_mapping else 0)
-            if not self.z_is_constant:
-                current_row_max_col = max(current_row_max_col, self.z_column)
-
-            if len(row) <= current_row_max_col:
-                self.report({'WARNING'}, f"Warning: Row {i+2} skipped for object creation: Not enough columns for selected data.")
-                continue
-
-            try:
-                # Determine X coordinate
-                x = x_category_map.get(row[self.x_column], 0) * self.categorical_spacing if self.x_is_categorical else float(row[self.x_column])
-
-                # Determine Z coordinate (height of bar)
-                z_data_val = self.z_constant_value
-                if not self.z_is_constant:
-                    z_data_val = z_category_map.get(row[self.z_column], 0) * self.categorical_spacing if self.z_is_categorical else float(row[self.z_column])
-
-                # Determine scale value (for Z-height of bar)
-                scale_val = 1.0
-                if self.scale_column != -1:
-                    try:
-                        scale_val = float(row[self.scale_column])
-                        if scale_val <= 0:
-                            scale_val = 0.01
-                    except ValueError:
-                        self.report({'WARNING'}, f"Warning: Row {i+2} skipped for scale: Non-numeric data in Scale Column. Defaulting scale to 1.0.")
-                        scale_val = 1.0
-
-                # Define scale for X, Y, Z axes of the primitive
-                scale_x = 1.0
-                scale_y = 1.0
-                scale_z = 1.0
-
-                if self.primitive_type == 'CUBE':
-                    scale_z = scale_val # Z is height
-                    scale_x = 1.0 # Fixed width
-                    scale_y = 1.0 # Fixed depth
-                    adjusted_z_location = self.z_constant_value + (scale_z / 2.0) # Base at Z_constant_value
-                    primitive_location = (x, y_base_coord, adjusted_z_location)
-                else: # For other primitives, uniform scaling is typical
-                    scale_x = scale_val
-                    scale_y = scale_val
-                    scale_z = scale_val
-                    primitive_location = (x, y_base_coord, z_data_val) # Use z_data_val for sphere/cone/cylinder center
+        # Everything built from the data hangs off one root that carries the Y offset,
+        # so the visualization can be moved afterwards without rebuilding it
+        viz_root = bpy.data.objects.new("CSV_Viz_Root", None)
+        viz_root.location = (0.0, self.y_offset, 0.0)
+        y_base_coord = 0.0 # Base Y coordinate for all objects, relative to viz_root
+
+        self._mat_cache = {} # Materials used by this run, by name
+        self._label_curves = {} # Label text curves made by this run, by label text
+        x_cells = columns[self.x_column]
+        row_count = len(row_lengths)
+
+        # Numeric columns are converted once up front; NaN marks cells that are not numbers.
+        # Geometry columns are float32, the precision Blender stores transforms in; color stays float64 for normalization
+        if self.x_is_categorical:
+            x_vals = _category_positions(x_cells, x_category_map, self.categorical_spacing)
+        else:
+            x_vals = _to_float_array(x_cells, np.float32)
 
+        z_vals = np.full(row_count, self.z_constant_value, dtype=np.float32)
+        if not self.z_is_constant:
+            z_cells = columns[self.z_column]
+            if self.z_is_categorical:
+                z_vals = _category_positions(z_cells, z_category_map, self.categorical_spacing)
+            else:
+                z_vals = _to_float_array(z_cells, np.float32)
+
+        color_vals = _to_float_array(columns[self.color_column]) if self.enable_color_mapping else None
+
+        # Rows with a non-numeric X, Z or color cell are skipped as a data type mismatch
+        mismatch = np.isnan(x_vals) | np.isnan(z_vals)
+        if color_vals is not None:
+            mismatch |= np.isnan(color_vals)
+
+        # Non-numeric scales default to 1.0 and non-positive ones are clamped to 0.01
+        scale_vals = np.ones(row_count, dtype=np.float32)
+        bad_scale = np.zeros(row_count, dtype=bool)
+        if self.scale_column != -1:
+            scale_vals = _to_float_array(columns[self.scale_column], np.float32)
+            bad_scale = np.isnan(scale_vals)
+            scale_vals = np.where(bad_scale, 1.0, np.where(scale_vals <= 0, 0.01, scale_vals))
+
+        # Color mapping gives each row a Blue to Red object color; a zero value range leaves mapping off
+        color_rgba = None
+        if color_vals is not None and max_color_val > min_color_val:
+            normalized = np.clip((np.nan_to_num(color_vals) - min_color_val) / (max_color_val - min_color_val), 0.0, 1.0)
+            color_rgba = np.column_stack((normalized, np.zeros(row_count), 1.0 - normalized, np.ones(row_count))).astype(np.float32)
+        color_mapped = color_rgba is not None
+
+        # Skip rows that don't have enough columns for the selected properties
+        current_row_max_col = max(self.x_column, self.y_column, 
+                                  self.scale_column if self.scale_column != -1 else 0,
+                                  self.color_column if self.enable_color_mapping else 0)
+        if not self.z_is_constant:
+            current_row_max_col = max(current_row_max_col, self.z_column)
+        short_rows = row_lengths <= current_row_max_col
+        if short_rows.any():
+            self.report({'WARNING'}, f"Warning: {short_rows.sum()} row(s) skipped for object creation: Not enough columns for selected data (first: row {np.flatnonzero(short_rows)[0] + 2}).")
+        mismatch &= ~short_rows
+        if mismatch.any():
+            self.report({'WARNING'}, f"Warning: {mismatch.sum()} row(s) skipped due to data type mismatch (first: row {np.flatnonzero(mismatch)[0] + 2}). Ensure numerical columns contain only numbers.")
+        creatable = ~short_rows & ~mismatch
+        created_rows = np.flatnonzero(creatable)
+
+        defaulted_scale = bad_scale & creatable
+        if defaulted_scale.any():
+            self.report({'WARNING'}, f"Warning: {defaulted_scale.sum()} row(s) had non-numeric data in Scale Column (first: row {np.flatnonzero(defaulted_scale)[0] + 2}). Defaulting scale to 1.0.")
+
+        # Placement depends only on the primitive type, so it is decided once for all rows
+        y_vals = np.full(row_count, y_base_coord, dtype=np.float32)
+        if self.primitive_type == 'CUBE':
+            # Z is height: fixed width and depth, base at z_constant_value
+            locations = np.column_stack((x_vals, y_vals, self.z_constant_value + scale_vals / 2.0))
+            unit = np.ones(row_count, dtype=np.float32)
+            scales = np.column_stack((unit, unit, scale_vals))
+        else:
+            # Other primitives are centered on their Z value and scale uniformly
+            locations = np.column_stack((x_vals, y_vals, z_vals))
+            scales = np.repeat(scale_vals[:, None], 3, axis=1)
+
+        make_labels = self.x_is_categorical and self.enable_labels
+        label_y_pos = y_base_coord - (self.categorical_spacing / 4.0) # Position below bar, at its base
+        label_z_pos = self.z_constant_value - 0.5
+        object_prefix = f"CSV_{self.primitive_type}_"
+
+        created_row_list = created_rows.tolist()
+        x_vals = x_vals.tolist()
+
+        # Non-primitive objects that also need to be framed by the camera
+        extra_objects = []
+
+        if self.use_instancing:
+            # One object for all rows; alternating colors become per-point colors too
+            point_colors = color_rgba[created_rows] if color_mapped else None
+            if not color_mapped and self.enable_alternating_colors and self.primitive_type == 'CUBE':
+                point_colors = np.where((created_rows % 2 == 0)[:, None], (*self.color_a, 1.0), (*self.color_b, 1.0)).astype(np.float32)
+            if len(created_rows):
+                points_obj = self._create_instanced_points(viz_collection, locations[created_rows], scales[created_rows], point_colors)
+                points_obj.parent = viz_root
+        else:
+            template_mesh = self._create_template_mesh()
+            for i in created_row_list:
                 # Create primitive
-                obj = self._create_primitive(primitive_location, (scale_x, scale_y, scale_z))
-                obj.name = f"CSV_{self.primitive_type}_{i+1}"
+                obj = self._create_primitive(template_mesh, f"{object_prefix}{i+1}")
+                obj.parent = viz_root
 
                 # Apply material
-                color_for_material = float(row[self.color_column]) if self.enable_color_mapping and len(row) > self.color_column else None
-                self._apply_material(obj, i, color_for_material, min_color_val, max_color_val)
+                self._apply_material(obj, i, color_mapped)
 
                 # Link the object to visualization collection
-                bpy.context.collection.objects.unlink(obj)
                 viz_collection.objects.link(obj)
 
-                # Add label if X is categorical and labels are enabled
-                if self.x_is_categorical and self.enable_labels:
-                    label_text = row[self.x_column]
-                    label_y_pos = y_base_coord - (self.categorical_spacing / 4.0) # Position below bar, at its base
-                    label_location = (x, label_y_pos, self.z_constant_value - 0.5)
-                    self._create_label(label_text, label_location, self.label_size, viz_collection)
-
-            except ValueError as ve:
-                self.report({'WARNING'}, f"Warning: Row {i+2} skipped due to data type mismatch. Ensure numerical columns contain only numbers. Error: {ve}")
-            except IndexError as ie:
-                self.report({'WARNING'}, f"Warning: Row {i+2} skipped: Missing data for specified columns. Error: {ie}")
+            # The collection was emptied by the clear, so it now holds exactly the primitives, in row order
+            viz_collection.objects.foreach_set("location", locations[created_rows].ravel())
+            viz_collection.objects.foreach_set("scale", scales[created_rows].ravel())
+            if color_mapped:
+                viz_collection.objects.foreach_set("color", color_rgba[created_rows].ravel())
+        viz_collection.objects.link(viz_root) # Only after the bulk writes, which rely on the collection holding just the primitives
+
+        # Add labels if X is categorical and labels are enabled
+        if make_labels:
+            for i in created_row_list:
+                label_location = (x_vals[i], label_y_pos, label_z_pos)
+                label_obj = self._create_label(x_cells[i], label_location, self.label_size, viz_collection)
+                label_obj.parent = viz_root
+                extra_objects.append(label_obj)
 
         # 7. Create X-Axis Line
-        self._create_axis_line(viz_collection, x_cat_counter, y_base_coord)
+        axis_obj = self._create_axis_line(viz_collection, x_cat_counter, y_base_coord)
+        if axis_obj is not None:
+            axis_obj.parent = viz_root
+            extra_objects.append(axis_obj)
+
+        # The collection joins the scene only now, so the whole build is a single depsgraph change
+        if viz_collection.name not in context.scene.collection.children:
+            context.scene.collection.children.link(viz_collection)
 
         # 8. Setup Camera and Lighting
+        # Objects made through bpy.data have no evaluated matrix_world until the view layer updates
+        context.view_layer.update()
         if self.camera_preset != 'NONE':
-            self.setup_camera(context, viz_collection)
+            # Unit primitives extend 0.5 * scale from their center along each axis
+            primitive_bounds = None
+            if len(created_rows):
+                created_locations = locations[created_rows] + (0.0, self.y_offset, 0.0) # World space, under viz_root
+                half_extents = 0.5 * np.abs(scales[created_rows])
+                primitive_bounds = ((created_locations - half_extents).min(axis=0), (created_locations + half_extents).max(axis=0))
+            self.setup_camera(context, viz_collection, primitive_bounds, extra_objects)
         if self.lighting_preset != 'NONE':
             self.setup_lighting(context, viz_collection)
 
@@ -739,6 +965,7 @@ class CSV_PT_DataVizPanel(bpy.types.Panel):
                 row.enabled = True
             else:
                 row.prop(props, "primitive_type")
+            col.prop(props, "use_instancing")
 
             col.prop(props, "enable_color_mapping")
             if props.enable_color_mapping:
@@ -794,6 +1021,7 @@ class CSV_PT_DataVizPanel(bpy.types.Panel):
         op.z_column = props.z_column
         op.scale_column = props.scale_column
         op.primitive_type = props.primitive_type
+        op.use_instancing = props.use_instancing
         op.enable_color_mapping = props.enable_color_mapping
         op.color_column = props.color_column
         op.x_is_categorical = props.x_is_categorical
@@ -892,6 +1120,11 @@ class CSVVizProperties(bpy.types.PropertyGroup):
         description="Choose the type of 3D primitive to visualize the data",
         default='CUBE'
     )
+    use_instancing: bpy.props.BoolProperty(
+        name="Use Instancing",
+        description="Draw all data points as Geometry Nodes instances on a single point cloud object instead of one object per row (much faster for large CSVs)",
+        default=False
+    )
     enable_color_mapping: bpy.props.BoolProperty(
         name="Enable Color Mapping",
         description="Color objects based on a data column",
@@ -954,14 +1187,14 @@ class CSVVizProperties(bpy.types.PropertyGroup):
     color_a: bpy.props.FloatVectorProperty(
         name="Color A",
         subtype='COLOR',
-        default=(0.2, 0.4, 0.8, 1.0), # Blue
-        min=0.0, max=1.0, size=4
+        default=(0.2, 0.4, 0.8), # Blue
+        min=0.0, max=1.0, size=3 # RGB; alpha is always opaque
     )
     color_b: bpy.props.FloatVectorProperty(
         name="Color B",
         subtype='COLOR',
-        default=(0.8, 0.2, 0.4, 1.0), # Reddish
-        min=0.0, max=1.0, size=4
+        default=(0.8, 0.2, 0.4), # Reddish
+        min=0.0, max=1.0, size=3 # RGB; alpha is always opaque
     )
     y_offset: bpy.props.FloatProperty(
         name="Y Offset",
@@ -1041,6 +1274,7 @@ def unregister():
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
     del bpy.types.Scene.csv_viz_props
+    _CSV_CACHE.clear()
 
 if __name__ == "__main__":
     register()